@@ -0,0 +1,41 @@
+"""Add partial indexes for task list and stats queries
+
+Revision ID: b7e2a4c91d3f
+Revises: 639d21ff019c
+Create Date: 2026-10-15 10:12:40.118532
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b7e2a4c91d3f"
+down_revision: Union[str, Sequence[str], None] = "639d21ff019c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_owner_active_created",
+        "tasks",
+        ["owner_id", sa.text("created_at DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_task_overdue",
+        "tasks",
+        ["owner_id", "due_date"],
+        postgresql_where=sa.text("deleted_at IS NULL AND status NOT IN ('done', 'archived')"),
+    )
+    op.create_index(
+        "ix_task_owner_status",
+        "tasks",
+        ["owner_id", "status"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_owner_status", table_name="tasks")
+    op.drop_index("ix_task_overdue", table_name="tasks")
+    op.drop_index("ix_task_owner_active_created", table_name="tasks")
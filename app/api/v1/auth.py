@@ -40,7 +40,7 @@ class PasswordResetConfirm(BaseModel):
 async def register(*, request: Request, db: Session = Depends(get_db), user_in: UserCreate) -> Any:
     rate_limit_auth(request)
     try:
-        user = UserService.create(db=db, user_create=user_in)
+        user = await UserService.create(db=db, user_create=user_in)
         try:
             await email_service.send_welcome_email(user.email, user.full_name)
         except Exception as e:
@@ -100,7 +100,7 @@ async def request_password_reset(*, request: Request, db: Session = Depends(get_
 @router.post("/reset-password", response_model=SuccessResponse, summary="Reset password")
 async def reset_password(*, request: Request, db: Session = Depends(get_db), password_reset: PasswordResetConfirm) -> Any:
     rate_limit_auth(request)
-    success = PasswordResetService.reset_password_with_token(db=db, reset_token=password_reset.token, new_password=password_reset.new_password)
+    success = await PasswordResetService.reset_password_with_token(db=db, reset_token=password_reset.token, new_password=password_reset.new_password)
     if not success:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired reset token")
     return SuccessResponse(message="Password reset successfully")
@@ -2,13 +2,14 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query, Request, status, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db, get_current_user
 from app.core.middleware import rate_limit_general
 from app.core.exceptions import NotFoundError, ConflictError
 from app.db.models.user import User
-from app.db.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.db.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
 from app.db.schemas.error import SuccessResponse
 from app.services.task_service import (
     TaskService,
@@ -24,7 +25,7 @@ ALLOWED_SORT_FIELDS = {"created_at", "updated_at", "due_date", "priority", "stat
 
 
 # ---------- LIST + FILTERS ----------
-@router.get("/", response_model=Dict[str, Any])
+@router.get("/", response_model=TaskListResponse)
 async def list_tasks(
     *,
     request: Request,
@@ -42,6 +43,7 @@ async def list_tasks(
     include_deleted: bool = Query(False),
     sort_by: str = Query("created_at"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from the previous page"),
 ) -> Any:
     rate_limit_general(request)
 
@@ -62,14 +64,19 @@ async def list_tasks(
     )
     sort_params = TaskSortParams(sort_by=sort_by, sort_order=sort_order)
 
-    return TaskService.get_user_tasks(
-        db=db,
-        user_id=current_user.id,
-        skip=skip,
-        limit=limit,
-        filters=filters,
-        sort_params=sort_params,
-        include_deleted=include_deleted,
+    # The service already builds the TaskListResponse shape from plain rows;
+    # hand it to orjson directly instead of re-validating it through Pydantic
+    return ORJSONResponse(
+        TaskService.get_user_tasks(
+            db=db,
+            user_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            sort_params=sort_params,
+            include_deleted=include_deleted,
+            cursor=cursor,
+        )
     )
 
 
@@ -96,7 +103,8 @@ async def get_task(
 ) -> Any:
     rate_limit_general(request)
     task = TaskService.get_task_by_id(db=db, task_id=task_id, user_id=current_user.id)
-    if not task:
+    # Soft-deleted tasks stay reachable only through restore
+    if not task or task.deleted_at is not None:
         raise HTTPException(status_code=404, detail="Task not found")
     return TaskResponse.from_orm(task)
 
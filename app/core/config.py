@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     algorithm: str
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    bcrypt_rounds: int = 12
 
     # Rate limiting
     rate_limit_per_minute: int = 100
@@ -27,6 +28,7 @@ class Settings(BaseSettings):
     app_name: str = "TaskFlow API"
     version: str = "1.0.0"
     debug: bool = False
+    testing: bool = False
 
     # Redis
     redis_url: str = "redis://redis:6379/0"
@@ -7,6 +7,7 @@ from app.core.security import verify_token
 from app.core.redis_client import redis_client, RedisClient
 from app.db.session import get_db
 from app.db.models.user import User
+from app.services.user_service import UserService
 
 security = HTTPBearer()
 
@@ -26,7 +27,7 @@ def get_current_user(
     if token_data is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == token_data).first()
+    user = UserService.get_by_email_cached(db, token_data)
     if user is None:
         raise credentials_exception
 
@@ -1,12 +1,26 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Union, Optional, Tuple, List
 
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """Build the CryptContext (and import passlib/bcrypt) on first use only."""
+    from passlib.context import CryptContext
+
+    # Test runs swap bcrypt for a no-op scheme; hashing cost is irrelevant there
+    if settings.testing:
+        return CryptContext(schemes=["plaintext"], deprecated="auto")
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=settings.bcrypt_rounds, deprecated="auto")
+
+# bcrypt releases the GIL, so a thread pool is enough to keep hashing off the event loop.
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="pwd-hash")
 
 def _create_token(subject: Union[str, Any], expires_delta: timedelta, token_type: str) -> str:
     expire = datetime.utcnow() + expires_delta
@@ -52,10 +66,14 @@ def verify_refresh_token(token: str) -> Optional[str]:
     return _verify_token(token, expected_type="refresh")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+async def get_password_hash_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_EXECUTOR, get_password_hash, password)
 
 def validate_password_strength(password: str) -> Tuple[bool, List[str]]:
     errors: List[str] = []
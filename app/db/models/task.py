@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, text
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.dialects.postgresql import ENUM as PGEnum
 from .base import BaseModel
@@ -20,34 +20,43 @@ class TaskPriority(str, enum.Enum):
     URGENT = "urgent"
 
 
+# Precomputed lookups: enum members, their values and accepted aliases all hash
+# to the same key, so normalization is a single dict hit in the common case.
+_STATUS_LOOKUP = {member.value: member for member in TaskStatus}
+_STATUS_LOOKUP.update({
+    "inprogress": TaskStatus.IN_PROGRESS,
+    "in progress": TaskStatus.IN_PROGRESS,
+    "in-progress": TaskStatus.IN_PROGRESS,
+})
+_PRIORITY_LOOKUP = {member.value: member for member in TaskPriority}
+
+
 def _normalize_status(value) -> TaskStatus:
-    if isinstance(value, TaskStatus):
-        return value
-    import enum as py_enum
-    if isinstance(value, py_enum.Enum):
-        value = value.value
     if value is None:
         return TaskStatus.TODO
-    s = str(value).strip().lower().replace("-", "_")
-    aliases = {"inprogress": "in_progress", "in progress": "in_progress"}
-    s = aliases.get(s, s)
-    return TaskStatus(s)
+    hit = _STATUS_LOOKUP.get(value)
+    if hit is None:
+        hit = _STATUS_LOOKUP.get(str(value.value if isinstance(value, enum.Enum) else value).strip().lower())
+    if hit is None:
+        raise ValueError(f"{value!r} is not a valid TaskStatus")
+    return hit
 
 
 def _normalize_priority(value) -> TaskPriority:
-    if isinstance(value, TaskPriority):
-        return value
-    import enum as py_enum
-    if isinstance(value, py_enum.Enum):
-        value = value.value
     if value is None:
         return TaskPriority.MEDIUM
-    s = str(value).strip().lower()
-    return TaskPriority(s)
+    hit = _PRIORITY_LOOKUP.get(value)
+    if hit is None:
+        hit = _PRIORITY_LOOKUP.get(str(value.value if isinstance(value, enum.Enum) else value).strip().lower())
+    if hit is None:
+        raise ValueError(f"{value!r} is not a valid TaskPriority")
+    return hit
 
 
 class Task(BaseModel):
     __tablename__ = "tasks"
+    # Fetch server defaults (status, priority) via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
@@ -111,3 +120,24 @@ class Task(BaseModel):
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}', owner_id={self.owner_id})>"
+
+
+# Partial indexes matching the filters and ordering used by TaskService
+Index(
+    "ix_task_owner_active_created",
+    Task.owner_id,
+    Task.created_at.desc(),
+    postgresql_where=text("deleted_at IS NULL"),
+)
+Index(
+    "ix_task_overdue",
+    Task.owner_id,
+    Task.due_date,
+    postgresql_where=text("deleted_at IS NULL AND status NOT IN ('done', 'archived')"),
+)
+Index(
+    "ix_task_owner_status",
+    Task.owner_id,
+    Task.status,
+    postgresql_where=text("deleted_at IS NULL"),
+)
@@ -1,11 +1,11 @@
 from .user import UserCreate, UserResponse, UserUpdate, UserLogin
 from .token import Token, TokenData
-from .task import TaskCreate, TaskResponse, TaskUpdate
+from .task import TaskCreate, TaskResponse, TaskUpdate, TaskListResponse
 from .category import CategoryCreate, CategoryResponse, CategoryUpdate
 
 __all__ = [
     "UserCreate", "UserResponse", "UserUpdate", "UserLogin",
     "Token", "TokenData",
-    "TaskCreate", "TaskResponse", "TaskUpdate",
+    "TaskCreate", "TaskResponse", "TaskUpdate", "TaskListResponse",
     "CategoryCreate", "CategoryResponse", "CategoryUpdate",
 ]
\ No newline at end of file
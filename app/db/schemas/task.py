@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, constr
+from pydantic import BaseModel, ConfigDict, constr
 
 from app.db.schemas.category import CategoryShort
 
@@ -19,6 +19,8 @@ class TaskPriority(str, Enum):
     urgent = "urgent"
 
 class TaskBase(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     title: constr(min_length=1, max_length=200)
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
@@ -29,6 +31,8 @@ class TaskCreate(TaskBase):
     category_id: Optional[int] = None
 
 class TaskUpdate(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     title: Optional[constr(min_length=1, max_length=200)] = None
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
@@ -42,5 +46,12 @@ class TaskResponse(TaskBase):
     category: Optional[CategoryShort] = None
     due_date: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class TaskListResponse(BaseModel):
+    tasks: List[TaskResponse]
+    total: Optional[int] = None  # not computed in cursor mode
+    skip: int
+    limit: int
+    has_more: bool
+    next_cursor: Optional[str] = None
@@ -12,7 +12,6 @@ def create_default_category_for_user(db: Session, user_id: int) -> Category:
     )
     db.add(default_category)
     db.commit()
-    db.refresh(default_category)
     return default_category
 
 
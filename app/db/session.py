@@ -7,12 +7,15 @@ from app.core.config import settings
 from app.db.models.base import Base
 
 # SQLAlchemy engine
-engine = create_engine(settings.database_url, echo=False, future=True)
+# Larger compiled-statement cache (default 500) so filter/sort variants of the task queries stay compiled
+engine = create_engine(settings.database_url, echo=False, future=True, query_cache_size=1200)
 
 # Session factory
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    # Keep loaded values after commit so building responses doesn't re-SELECT rows
+    expire_on_commit=False,
     bind=engine,
 )
 
@@ -6,7 +6,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.core.config import settings
 from app.core.exception_handlers import (
@@ -29,6 +29,7 @@ app = FastAPI(
     version=settings.version,
     description="RESTful API for personal task management with team collaboration features",
     openapi_url="/api/v1/openapi.json" if settings.debug else None,
+    default_response_class=ORJSONResponse,
 )
 
 # ----------------- MIDDLEWARE -----------------
@@ -59,7 +60,7 @@ async def request_validation_handler(request: Request, exc: RequestValidationErr
     details = []
     for err in exc.errors():
         field = err.get("loc", ["body"])[-1]
-        details.append({"field": str(field), "message": err.get("msg")})
+        details.append({"type": "validation_error", "field": str(field), "message": err.get("msg")})
 
     try:
         body = await request.body()
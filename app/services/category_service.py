@@ -77,7 +77,6 @@ class CategoryService:
 
         db.add(db_category)
         db.commit()
-        db.refresh(db_category)
 
         logger.info(f"Created category '{db_category.name}' for user {user_id}")
         return db_category
@@ -118,7 +117,6 @@ class CategoryService:
             setattr(category, field, value)
 
         db.commit()
-        db.refresh(category)
 
         logger.info(f"Updated category {category_id} for user {user_id}")
         return category
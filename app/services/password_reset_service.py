@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 import secrets
 from app.core.redis_client import redis_client
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password
 from app.services.email_service import email_service
 from app.db.models.user import User
 from sqlalchemy.orm import Session
@@ -48,7 +48,7 @@ class PasswordResetService:
         return True
 
     @staticmethod
-    def reset_password_with_token(
+    async def reset_password_with_token(
             db: Session,
             reset_token: str,
             new_password: str
@@ -71,8 +71,9 @@ class PasswordResetService:
             return False
 
         # Update password
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await get_password_hash_async(new_password)
         db.commit()
+        UserService.invalidate_cache(user.email)
 
         # Delete reset token
         redis_client.delete(key)
@@ -1,12 +1,13 @@
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import and_, or_, desc, asc
-from app.db.models.task import Task, TaskStatus, TaskPriority
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, desc, asc, tuple_, func, literal_column, lambda_stmt, select
+from app.db.models.task import Task, TaskStatus, TaskPriority, _normalize_status, _normalize_priority
+from app.db.models.category import Category
 from app.db.schemas.task import TaskCreate, TaskUpdate, TaskResponse
-from app.core.exceptions import NotFoundError, ConflictError
+from app.core.exceptions import NotFoundError, ConflictError, ValidationError
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import base64
 import logging
-import enum as py_enum
 
 logger = logging.getLogger(__name__)
 
@@ -37,28 +38,55 @@ class TaskSortParams:
         self.sort_order = sort_order
 
 
-def _normalize_status(value) -> TaskStatus:
-    if isinstance(value, TaskStatus):
-        return value
-    if isinstance(value, py_enum.Enum):
-        value = value.value
-    if value is None:
-        return TaskStatus.TODO
-    s = str(value).strip().lower().replace("-", "_")
-    aliases = {"inprogress": "in_progress", "in progress": "in_progress"}
-    s = aliases.get(s, s)
-    return TaskStatus(s)
-
-
-def _normalize_priority(value) -> TaskPriority:
-    if isinstance(value, TaskPriority):
-        return value
-    if isinstance(value, py_enum.Enum):
-        value = value.value
-    if value is None:
-        return TaskPriority.MEDIUM
-    s = str(value).strip().lower()
-    return TaskPriority(s)
+def _db_utcnow():
+    """Current UTC time evaluated by Postgres, comparable with the naive UTC columns."""
+    return func.timezone("utc", func.now())
+
+
+# Flat columns rendered by the task list; selecting them directly skips ORM hydration
+_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.owner_id,
+    Task.category_id,
+    Task.created_at,
+    Category.name.label("category_name"),
+)
+
+
+def _task_row_to_dict(row) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status,
+        "priority": row.priority,
+        "due_date": row.due_date,
+        "owner_id": row.owner_id,
+        "category": (
+            {"id": row.category_id, "name": row.category_name}
+            if row.category_id is not None
+            else None
+        ),
+    }
+
+
+def _encode_cursor(task) -> str:
+    raw = f"{task.created_at.isoformat()}|{task.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, task_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), int(task_id)
+    except ValueError:
+        raise ValidationError(detail="Invalid cursor")
 
 
 class TaskService:
@@ -71,11 +99,12 @@ class TaskService:
         filters: Optional[TaskFilterParams] = None,
         sort_params: Optional[TaskSortParams] = None,
         include_deleted: bool = False,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         query = (
-            db.query(Task)
+            db.query(*_LIST_COLUMNS)
+            .outerjoin(Category, Task.category_id == Category.id)
             .filter(Task.owner_id == user_id)
-            .options(selectinload(Task.category))
         )
 
         if not include_deleted:
@@ -84,21 +113,40 @@ class TaskService:
         if filters:
             query = TaskService._apply_filters(query, filters)
 
-        if sort_params:
-            query = TaskService._apply_sorting(query, sort_params)
+        # Keyset pagination walks (created_at, id) in descending order
+        keyset_order = sort_params is None or (
+            sort_params.sort_by == "created_at" and sort_params.sort_order.lower() == "desc"
+        )
+        if cursor and not keyset_order:
+            raise ValidationError(detail="Cursor pagination requires sorting by created_at desc")
+
+        if keyset_order:
+            query = query.order_by(desc(Task.created_at), desc(Task.id))
         else:
-            query = query.order_by(desc(Task.created_at))
+            query = TaskService._apply_sorting(query, sort_params)
 
-        total = query.count()
-        tasks = query.offset(skip).limit(limit).all()
-        tasks_response = [TaskResponse.from_orm(task) for task in tasks]
+        if cursor:
+            cursor_created_at, cursor_id = _decode_cursor(cursor)
+            rows = (
+                query.filter(tuple_(Task.created_at, Task.id) < (cursor_created_at, cursor_id))
+                .limit(limit + 1)
+                .all()
+            )
+            tasks = rows[:limit]
+            total = None
+            has_more = len(rows) > limit
+        else:
+            total = query.count()
+            tasks = query.offset(skip).limit(limit).all()
+            has_more = skip + len(tasks) < total
 
         return {
-            "tasks": tasks_response,
+            "tasks": [_task_row_to_dict(row) for row in tasks],
             "total": total,
             "skip": skip,
             "limit": limit,
-            "has_more": skip + len(tasks) < total,
+            "has_more": has_more,
+            "next_cursor": _encode_cursor(tasks[-1]) if keyset_order and has_more else None,
         }
 
     @staticmethod
@@ -117,17 +165,15 @@ class TaskService:
             like = f"%{filters.search}%"
             query = query.filter(or_(Task.title.ilike(like), Task.description.ilike(like)))
         if filters.is_overdue is True:
-            now = datetime.utcnow()
             query = query.filter(
                 and_(
                     Task.due_date.isnot(None),
-                    Task.due_date < now,
+                    Task.due_date < _db_utcnow(),
                     Task.status.notin_([TaskStatus.DONE, TaskStatus.ARCHIVED]),
                 )
             )
         if filters.is_overdue is False:
-            now = datetime.utcnow()
-            query = query.filter(or_(Task.due_date.is_(None), Task.due_date >= now))
+            query = query.filter(or_(Task.due_date.is_(None), Task.due_date >= _db_utcnow()))
         return query
 
     @staticmethod
@@ -169,13 +215,16 @@ class TaskService:
         db_task = Task(**kwargs)
 
         db.add(db_task)
+        db.flush()
+        response = TaskResponse.from_orm(db_task)
         db.commit()
-        db.refresh(db_task)
-        return TaskResponse.from_orm(db_task)
+        return response
 
     @staticmethod
     def get_task_by_id(db: Session, task_id: int, user_id: int) -> Optional[Task]:
-        return db.query(Task).filter(and_(Task.id == task_id, Task.owner_id == user_id)).first()
+        # Hot path for every single-task endpoint; lambda_stmt caches the statement construction too
+        stmt = lambda_stmt(lambda: select(Task).where(Task.id == task_id, Task.owner_id == user_id).limit(1))
+        return db.execute(stmt).scalars().first()
 
     @staticmethod
     def update_task(db: Session, task_id: int, task_update: TaskUpdate, user_id: int) -> TaskResponse:
@@ -193,9 +242,12 @@ class TaskService:
         for f, v in data.items():
             setattr(task, f, v)
 
+        db.flush()
+        if "category_id" in data:
+            db.expire(task, ["category"])
+        response = TaskResponse.from_orm(task)
         db.commit()
-        db.refresh(task)
-        return TaskResponse.from_orm(task)
+        return response
 
     @staticmethod
     def soft_delete_task(db: Session, task_id: int, user_id: int) -> bool:
@@ -212,9 +264,10 @@ class TaskService:
         if not task:
             raise NotFoundError(detail="Task not found")
         task.deleted_at = None
+        db.flush()
+        response = TaskResponse.from_orm(task)
         db.commit()
-        db.refresh(task)
-        return TaskResponse.from_orm(task)
+        return response
 
     @staticmethod
     def archive_task(db: Session, task_id: int, user_id: int) -> TaskResponse:
@@ -224,9 +277,10 @@ class TaskService:
         if task.status != TaskStatus.DONE:
             raise ConflictError(detail="Only completed tasks can be archived")
         task.status = TaskStatus.ARCHIVED
+        db.flush()
+        response = TaskResponse.from_orm(task)
         db.commit()
-        db.refresh(task)
-        return TaskResponse.from_orm(task)
+        return response
 
     @staticmethod
     def get_task_stats(db: Session, user_id: int) -> Dict[str, Any]:
@@ -234,19 +288,18 @@ class TaskService:
         total = base.count()
         status_counts = {s.value: base.filter(Task.status == s).count() for s in TaskStatus}
         priority_counts = {p.value: base.filter(Task.priority == p).count() for p in TaskPriority}
-        now = datetime.utcnow()
+        now = _db_utcnow()
         overdue = base.filter(
             and_(
                 Task.due_date < now,
                 Task.status.notin_([TaskStatus.DONE, TaskStatus.ARCHIVED]),
             )
         ).count()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+        today_start = func.date_trunc("day", now)
         due_today = base.filter(
             and_(
                 Task.due_date >= today_start,
-                Task.due_date <= today_end,
+                Task.due_date < today_start + literal_column("interval '1 day'"),
                 Task.status.notin_([TaskStatus.DONE, TaskStatus.ARCHIVED]),
             )
         ).count()
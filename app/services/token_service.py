@@ -8,6 +8,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 REFRESH_PREFIX = "refresh_token:"
+REFRESH_INDEX_PREFIX = "user_refresh_idx:"
 BLACKLIST_PREFIX = "blacklisted_token:"
 
 class TokenService:
@@ -39,9 +40,24 @@ class TokenService:
     # ===== Refresh storage & rotation =====
     @staticmethod
     def store_refresh_token(token: str, email: str) -> bool:
-        """Store refresh token with TTL; value = email. Used for rotation/validation."""
+        """Store refresh token with TTL; value = email. Used for rotation/validation.
+
+        The token is also added to a per-user set so all of a user's tokens
+        can be revoked without scanning the keyspace.
+        """
+        if not redis_client.redis_client:
+            return False
         ttl = settings.refresh_token_expire_days * 86400
-        return redis_client.set(f"{REFRESH_PREFIX}{token}", email, ex=ttl)
+        index_key = f"{REFRESH_INDEX_PREFIX}{email}"
+        try:
+            pipeline = redis_client.redis_client.pipeline()
+            pipeline.set(f"{REFRESH_PREFIX}{token}", email, ex=ttl)
+            pipeline.sadd(index_key, token)
+            pipeline.expire(index_key, ttl)
+            return bool(pipeline.execute()[0])
+        except Exception as e:
+            logger.error(f"Error storing refresh token: {e}")
+            return False
 
     @staticmethod
     def get_refresh_owner(token: str) -> Optional[str]:
@@ -49,9 +65,32 @@ class TokenService:
 
     @staticmethod
     def revoke_refresh_token(token: str) -> bool:
-        return redis_client.delete(f"{REFRESH_PREFIX}{token}")
+        if not redis_client.redis_client:
+            return False
+        key = f"{REFRESH_PREFIX}{token}"
+        try:
+            email = redis_client.redis_client.get(key)
+            pipeline = redis_client.redis_client.pipeline()
+            pipeline.delete(key)
+            if email:
+                pipeline.srem(f"{REFRESH_INDEX_PREFIX}{email}", token)
+            return bool(pipeline.execute()[0])
+        except Exception as e:
+            logger.error(f"Error revoking refresh token: {e}")
+            return False
 
     @staticmethod
     def revoke_all_user_refresh(email: str) -> None:
-        """(Опционально) реализовать pattern-scan по ключам"""
-        pass
+        """Revoke every refresh token issued to the user via the per-user index."""
+        if not redis_client.redis_client:
+            return
+        index_key = f"{REFRESH_INDEX_PREFIX}{email}"
+        try:
+            tokens = redis_client.redis_client.smembers(index_key)
+            pipeline = redis_client.redis_client.pipeline()
+            for token in tokens:
+                pipeline.delete(f"{REFRESH_PREFIX}{token}")
+            pipeline.delete(index_key)
+            pipeline.execute()
+        except Exception as e:
+            logger.error(f"Error revoking refresh tokens for {email}: {e}")
@@ -1,16 +1,68 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.db.models.user import User
 from app.db.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.redis_client import redis_client
+from app.core.security import get_password_hash_async, verify_password
 from typing import Optional
 from datetime import datetime
+import json
+
+USER_CACHE_PREFIX = "user:"
+USER_CACHE_TTL = 60
+
+# Columns needed to authenticate a request and render UserResponse
+_CACHED_FIELDS = ("id", "email", "first_name", "last_name", "is_active", "last_login", "created_at", "updated_at")
+_CACHED_DATETIME_FIELDS = ("last_login", "created_at", "updated_at")
+
+
+def _dump_user(user: User) -> str:
+    data = {field: getattr(user, field) for field in _CACHED_FIELDS}
+    for field in _CACHED_DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = data[field].isoformat()
+    return json.dumps(data)
+
+
+def _load_user(db: Session, raw: str) -> User:
+    data = json.loads(raw)
+    for field in _CACHED_DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    user = User(**data)
+    # Attach as an already-persisted row: no SELECT, uncached columns load lazily
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
 
 
 class UserService:
     @staticmethod
     def get_by_email(db: Session, email: str) -> Optional[User]:
         """Get user by email."""
-        return db.query(User).filter(User.email == email).first()
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email).limit(1))
+        return db.execute(stmt).scalars().first()
+
+    @staticmethod
+    def get_by_email_cached(db: Session, email: str) -> Optional[User]:
+        """Get user by email, serving repeated lookups from Redis.
+
+        Only UserService writes invalidate the entry; changes made elsewhere,
+        e.g. to ``is_active``, stay invisible for up to USER_CACHE_TTL seconds.
+        """
+        key = f"{USER_CACHE_PREFIX}{email}"
+        cached = redis_client.get(key)
+        if cached:
+            return _load_user(db, cached)
+
+        user = UserService.get_by_email(db, email)
+        if user:
+            redis_client.set(key, _dump_user(user), ex=USER_CACHE_TTL)
+        return user
+
+    @staticmethod
+    def invalidate_cache(email: str) -> None:
+        """Drop cached user data after it changes."""
+        redis_client.delete(f"{USER_CACHE_PREFIX}{email}")
 
     @staticmethod
     def get_by_id(db: Session, user_id: int) -> Optional[User]:
@@ -18,23 +70,23 @@ class UserService:
         return db.query(User).filter(User.id == user_id).first()
 
     @staticmethod
-    def create(db: Session, user_create: UserCreate) -> User:
+    async def create(db: Session, user_create: UserCreate) -> User:
         """Create new user."""
         # Check if user already exists
         if UserService.get_by_email(db, user_create.email):
             raise ValueError("User with this email already exists")
 
         # Create user with hashed password
+        hashed_password = await get_password_hash_async(user_create.password)
         db_user = User(
             email=user_create.email,
-            hashed_password=get_password_hash(user_create.password),
+            hashed_password=hashed_password,
             first_name=user_create.first_name,
             last_name=user_create.last_name,
         )
 
         db.add(db_user)
         db.commit()
-        db.refresh(db_user)
 
         # Create default category for user
         from app.db.seeds import create_default_category_for_user
@@ -51,7 +103,7 @@ class UserService:
             setattr(user, field, value)
 
         db.commit()
-        db.refresh(user)
+        UserService.invalidate_cache(user.email)
         return user
 
     @staticmethod
@@ -67,16 +119,18 @@ class UserService:
         # Update last login
         user.last_login = datetime.utcnow()
         db.commit()
+        UserService.invalidate_cache(user.email)
 
         return user
 
     @staticmethod
-    def reset_password(db: Session, email: str, new_password: str) -> bool:
+    async def reset_password(db: Session, email: str, new_password: str) -> bool:
         """Reset user password (simplified version)."""
         user = UserService.get_by_email(db, email)
         if not user:
             return False
 
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await get_password_hash_async(new_password)
         db.commit()
+        UserService.invalidate_cache(user.email)
         return True
\ No newline at end of file
@@ -1,12 +1,46 @@
+import hashlib
 import os
-from typing import Generator, Any, Callable, List, Dict
+from contextlib import contextmanager
+from itertools import cycle
+from typing import AsyncGenerator, Generator, Any, Callable, Iterator, List, Dict, Optional, Union
 from datetime import datetime
+from types import SimpleNamespace
 
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
+
+os.environ["ENV_FILE"] = ".env.test"
+
+from app.core.config import settings
+
+# Under pytest-xdist every worker ("gw0", "gw1", ...) gets its own Postgres database, and its
+# Redis DB is the configured one shifted by the worker number, wrapped within Redis' 16 default DBs.
+# The dev app uses DB 0 (.env.example) on the same host; a worker that would land there refuses to run,
+# because the session starts with FLUSHDB. The Redis URL must be set before app modules build the shared client.
+REDIS_DATABASES = 16
+APP_REDIS_DB = 0
+
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    _redis_base, _redis_db = settings.redis_url.rsplit("/", 1)
+    _worker_redis_db = (int(_redis_db) + int(XDIST_WORKER.lstrip("gw"))) % REDIS_DATABASES
+    if _worker_redis_db == APP_REDIS_DB:
+        raise pytest.UsageError(
+            f"xdist worker {XDIST_WORKER} would use Redis DB {APP_REDIS_DB}, the app's database; "
+            f"lower --maxprocesses"
+        )
+    settings.redis_url = f"{_redis_base}/{_worker_redis_db}"
+
 from faker import Faker
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text, insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection, Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from app.main import app
 from app.core.deps import get_db, get_redis
@@ -18,10 +52,27 @@ from app.db.models.user import User
 from app.db.models.category import Category
 from app.db.models.task import Task, TaskStatus, TaskPriority
 
-os.environ["ENV_FILE"] = ".env.test"
-from app.core.config import settings
-
 fake = Faker()
+fake.seed_instance(0xC0FFEE)
+
+
+def _pool(generate: Callable[[], Any], size: int = 200) -> Iterator[Any]:
+    """Pre-generate fake values once and hand them out round-robin."""
+    return cycle([generate() for _ in range(size)])
+
+
+# Deterministic data pools keep Faker out of per-test setup; emails are never reused
+EMAILS = iter([fake.unique.email() for _ in range(2000)])
+FIRST_NAMES = _pool(fake.first_name)
+LAST_NAMES = _pool(fake.last_name)
+WORDS = _pool(lambda: fake.unique.word().title())
+SENTENCES = _pool(lambda: fake.sentence(nb_words=3))
+SHORT_TEXTS = _pool(lambda: fake.text(max_nb_chars=100))
+TEXTS = _pool(lambda: fake.text(max_nb_chars=200))
+COLORS = _pool(fake.color)
+
+# Hash the shared fixture password once per session
+HASHED_TEST_PASSWORD = get_password_hash("TestPassword123!")
 
 # -----------------------
 # Helper Functions
@@ -35,125 +86,350 @@ def assert_error_response(response, expected_status: int, expected_message: str,
     assert any(d["type"] == expected_type for d in (data.get("details") or []))
 
 
+@contextmanager
+def count_queries(bind: Union[Engine, Connection]) -> Iterator[List[str]]:
+    """Collect the SQL statements executed on ``bind``'s engine inside the block."""
+    engine = bind.engine
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "after_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "after_cursor_execute", _record)
+
+
+# -----------------------
+# Slow Tests
+# -----------------------
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", default=False, help="also run tests marked as slow")
+    parser.addoption("--fresh-db", action="store_true", default=False, help="rebuild the template database")
+
+
+def pytest_configure(config):
+    # pytest.ini keeps its options under [tool:pytest], which pytest does not read, so register the marker here
+    config.addinivalue_line("markers", "slow: redundant or expensive checks, skipped unless --run-slow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_responses() -> Generator[None, None, None]:
+    """Decode response bodies with orjson for both TestClient and httpx.AsyncClient."""
+    patch = pytest.MonkeyPatch()
+    patch.setattr(httpx.Response, "json", lambda self, **kwargs: orjson.loads(self.content))
+    yield
+    patch.undo()
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _json_default(value: Any) -> str:
+    """Fallback for types orjson can't encode natively, e.g. Decimal; orjson already handles enums."""
+    return str(value)
+
+
+def request_json(client, method: str, url: str, payload: Any, headers: Optional[Dict[str, str]] = None, **kwargs):
+    """Send ``payload`` encoded with orjson; works with TestClient and httpx.AsyncClient alike."""
+    return client.request(
+        method,
+        url,
+        content=orjson.dumps(payload, default=_json_default),
+        headers={**_JSON_HEADERS, **(headers or {})},
+        **kwargs,
+    )
+
+
+def post_json(client, url: str, payload: Any, **kwargs):
+    return request_json(client, "POST", url, payload, **kwargs)
+
+
+def put_json(client, url: str, payload: Any, **kwargs):
+    return request_json(client, "PUT", url, payload, **kwargs)
+
+
+def patch_json(client, url: str, payload: Any, **kwargs):
+    return request_json(client, "PATCH", url, payload, **kwargs)
+
+
+def auth_headers_for(email: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {AuthService.create_access_token_for_user(email)}"}
+
+
 # -----------------------
 # Database Fixtures
 # -----------------------
-test_engine = create_engine(settings.database_url, echo=False, pool_pre_ping=True)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+_DB_SUFFIX = f"_{XDIST_WORKER}" if XDIST_WORKER else ""
+TEMPLATE_DB_NAME = f"{settings.POSTGRES_DB}_template{_DB_SUFFIX}"
+TEST_DB_NAME = f"{settings.POSTGRES_DB}_tests{_DB_SUFFIX}"
+
+# Matches SessionLocal: committed objects keep their loaded state instead of re-SELECTing on access
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+def _database_url(name: str) -> str:
+    return make_url(settings.database_url).set(database=name).render_as_string(hide_password=False)
+
+
+def _drop_database(conn: Connection, name: str) -> None:
+    conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+
+
+def _schema_fingerprint() -> str:
+    """Hash of the DDL the models would create; changes whenever a table, index or enum does."""
+    dialect = postgresql.dialect()
+    ddl = [repr(Task.__table__.c.status.type.enums), repr(Task.__table__.c.priority.type.enums)]
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda index: index.name)
+        )
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+def _template_is_current(conn: Connection, fingerprint: str) -> bool:
+    comment = conn.execute(
+        text("SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = :name"),
+        {"name": TEMPLATE_DB_NAME},
+    ).scalar()
+    return comment == fingerprint
+
+
+def _build_template_schema() -> None:
+    """Create enum types and tables inside the template database."""
+    engine = create_engine(_database_url(TEMPLATE_DB_NAME))
+    with engine.begin() as conn:
+        # Model enums use create_type=False (migrations own them), so create them explicitly
+        Task.__table__.c.status.type.create(conn, checkfirst=True)
+        Task.__table__.c.priority.type.create(conn, checkfirst=True)
+        Base.metadata.create_all(bind=conn)
+    # A database with open connections can't be used as a template
+    engine.dispose()
 
 
 @pytest.fixture(scope="session")
-def db_engine() -> Generator:
-    """Create and drop test database schema."""
-    Base.metadata.create_all(bind=test_engine)
-    yield test_engine
-    Base.metadata.drop_all(bind=test_engine)
+def db_engine(pytestconfig: pytest.Config) -> Generator:
+    """Run tests against a fresh clone of a template database.
+
+    The template is kept between runs and rebuilt only when the models' schema fingerprint
+    (stored as the database comment) changes or ``--fresh-db`` is given.
+    """
+    fingerprint = _schema_fingerprint()
+    admin_engine = create_engine(_database_url("postgres"), isolation_level="AUTOCOMMIT")
+    with admin_engine.connect() as conn:
+        _drop_database(conn, TEST_DB_NAME)
+        if pytestconfig.getoption("--fresh-db") or not _template_is_current(conn, fingerprint):
+            _drop_database(conn, TEMPLATE_DB_NAME)
+            conn.execute(text(f'CREATE DATABASE "{TEMPLATE_DB_NAME}" TEMPLATE template0'))
+            _build_template_schema()
+            conn.execute(text(f"COMMENT ON DATABASE \"{TEMPLATE_DB_NAME}\" IS '{fingerprint}'"))
+        conn.execute(text(f'CREATE DATABASE "{TEST_DB_NAME}" TEMPLATE "{TEMPLATE_DB_NAME}"'))
+
+    # Tests share the single session-scoped connection, so no pool or pre-ping is needed.
+    # Throwaway data: commits need not wait for the WAL flush.
+    engine = create_engine(
+        _database_url(TEST_DB_NAME),
+        echo=False,
+        poolclass=NullPool,
+        query_cache_size=1200,
+        connect_args={"options": "-c synchronous_commit=off"},
+    )
+    yield engine
+    engine.dispose()
 
+    with admin_engine.connect() as conn:
+        _drop_database(conn, TEST_DB_NAME)
+    admin_engine.dispose()
 
-@pytest.fixture
-def db_session(db_engine) -> Generator[Session, None, None]:
-    """Create a database session with rollback after test."""
+
+@pytest.fixture(scope="session")
+def _connection(db_engine) -> Generator[Connection, None, None]:
+    """Single connection reused by every test's transaction."""
     connection = db_engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def db_session(_connection: Connection) -> Generator[Session, None, None]:
+    """Create a database session with rollback after test.
+
+    Commits made by the code under test only release a SAVEPOINT, so the outer
+    transaction still discards everything when the test ends.
+    """
+    transaction = _connection.begin()
+    session = TestingSessionLocal(bind=_connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
         transaction.rollback()
-        connection.close()
 
 
 # -----------------------
 # Redis Fixture
 # -----------------------
-@pytest.fixture
-def redis_client() -> Generator[RedisClient, None, None]:
+@pytest.fixture(scope="session")
+def _redis_client() -> RedisClient:
+    """Single Redis connection shared by the whole test session."""
     client = RedisClient()
-    client.redis_client.flushdb()
-    yield client
-    client.redis_client.flushdb()
+    if client.redis_client:
+        client.redis_client.flushdb()
+    return client
+
+
+@pytest.fixture
+def redis_client(_redis_client: RedisClient) -> Generator[RedisClient, None, None]:
+    """Start every test from an empty Redis database.
+
+    The database is flushed once when the session starts and again after each test.
+    The app also writes through the ``app.core.redis_client`` singleton, so keys cannot
+    be scoped by a per-test prefix. A flush is the only complete cleanup.
+    FLUSHDB ASYNC frees the keys in the background, so teardown does not wait on it.
+    """
+    yield _redis_client
+    if _redis_client.redis_client:
+        _redis_client.redis_client.flushdb(asynchronous=True)
 
 
 # -----------------------
 # Test Client Fixture
 # -----------------------
-@pytest.fixture
-def client(db_session: Session, redis_client: RedisClient) -> Generator[TestClient, None, None]:
+@pytest.fixture(scope="session")
+def _test_client() -> Generator[TestClient, None, None]:
+    """Enter the app lifespan once; per-test state lives in dependency overrides."""
+    with TestClient(app) as test_client:
+        yield test_client
+    # Drop the OpenAPI schema if a test made FastAPI build it
+    app.openapi_schema = None
+
+
+@contextmanager
+def _override_dependencies(db_session: Session, redis_client: RedisClient) -> Iterator[None]:
     app.dependency_overrides[get_db] = lambda: db_session
     app.dependency_overrides[get_redis] = lambda: redis_client
+    try:
+        yield
+    finally:
+        # Drop only our own overrides; other fixtures may have installed theirs
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_redis, None)
+
+
+@pytest.fixture
+def client(_test_client: TestClient, db_session: Session, redis_client: RedisClient) -> Generator[TestClient, None, None]:
+    with _override_dependencies(db_session, redis_client):
+        yield _test_client
 
-    with TestClient(app) as test_client:
-        yield test_client
 
-    app.dependency_overrides.clear()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _async_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Call the app in-process over ASGI, without TestClient's portal thread."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture
+def async_client(
+    _async_client: httpx.AsyncClient, db_session: Session, redis_client: RedisClient
+) -> Generator[httpx.AsyncClient, None, None]:
+    """Async client for tests marked ``@pytest.mark.asyncio(loop_scope="session")``."""
+    with _override_dependencies(db_session, redis_client):
+        yield _async_client
 
 
 # -----------------------
 # User Fixtures
 # -----------------------
-@pytest.fixture
-def test_user(db_session: Session) -> User:
-    """Create a test user with default category."""
-    user = User(
-        email=fake.email(),
-        hashed_password=get_password_hash("TestPassword123!"),
-        first_name=fake.first_name(),
-        last_name=fake.last_name(),
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+@pytest.fixture(scope="session")
+def _seed(_connection: Connection) -> SimpleNamespace:
+    """Commit the shared user (with its default category), category and task in one transaction.
 
-    # Create default category
+    The rows are written with Core inserts before any test transaction starts. Tests only ever roll
+    back to their own transaction, so the rows survive the whole session.
+    """
     from app.db.seeds import create_default_category_for_user
-    create_default_category_for_user(db_session, user.id)
 
-    return user
+    user = SimpleNamespace(email=next(EMAILS), first_name=next(FIRST_NAMES), last_name=next(LAST_NAMES))
+    with _connection.begin():
+        user.id = _connection.execute(
+            insert(User).returning(User.id), {**vars(user), "hashed_password": HASHED_TEST_PASSWORD}
+        ).scalar_one()
+        # The session joins the open transaction; its commit leaves the outer COMMIT to the block
+        with TestingSessionLocal(bind=_connection) as session:
+            create_default_category_for_user(session, user.id)
+
+        category = SimpleNamespace(name=next(WORDS), description=next(SHORT_TEXTS), color="#FF6B35", owner_id=user.id)
+        category.id = _connection.execute(insert(Category).returning(Category.id), vars(category)).scalar_one()
+
+        task = SimpleNamespace(
+            title="Use actually.",
+            description="Test description",
+            status=TaskStatus.TODO,
+            priority=TaskPriority.MEDIUM,
+            owner_id=user.id,
+            category_id=category.id,
+        )
+        task.id = _connection.execute(insert(Task).returning(Task.id), vars(task)).scalar_one()
+    return SimpleNamespace(user=user, category=category, task=task)
 
 
-@pytest.fixture
-def another_user(db_session: Session) -> User:
-    """Create another test user for isolation tests."""
-    return test_user(db_session)
+@pytest.fixture(scope="session")
+def test_user(_seed: SimpleNamespace) -> SimpleNamespace:
+    """Plain attributes of the session-wide test user; load the row from db_session if needed."""
+    return _seed.user
 
 
 @pytest.fixture
-def auth_headers(test_user: User) -> Dict[str, str]:
-    """Create authorization headers for a user."""
-    token = AuthService.create_access_token_for_user(test_user.email)
-    return {"Authorization": f"Bearer {token}"}
+def another_user(user_factory: Callable[..., User]) -> User:
+    """Create another test user for isolation tests and tests that modify the user."""
+    return user_factory()
 
 
-@pytest.fixture
-def test_category(db_session: Session, test_user: User) -> Category:
-    """Create a single test category."""
-    category = Category(
-        name=fake.word().title(),
-        description=fake.text(max_nb_chars=100),
-        color="#FF6B35",
-        owner_id=test_user.id
-    )
-    db_session.add(category)
-    db_session.commit()
-    db_session.refresh(category)
-    return category
+@pytest.fixture(scope="session")
+def auth_headers(test_user: SimpleNamespace) -> Dict[str, str]:
+    """Authorization headers for the session-wide test user, signed once."""
+    return auth_headers_for(test_user.email)
+
+
+@pytest.fixture(scope="session")
+def test_category(_seed: SimpleNamespace) -> SimpleNamespace:
+    """Plain attributes of the session-wide test category; changes made by a test are rolled back."""
+    return _seed.category
+
+
+@pytest.fixture(scope="session")
+def test_task(_seed: SimpleNamespace) -> SimpleNamespace:
+    """Plain attributes of the session-wide test task; changes made by a test are rolled back."""
+    return _seed.task
 
 
 @pytest.fixture
-def test_task(db_session: Session, test_user: User, test_category: Category) -> Task:
-    """Create a single test task via TaskService for proper serialization."""
-    from app.services.task_service import TaskService
-    from app.db.schemas.task import TaskCreate
-
-    task_data = TaskCreate(
-        title="Use actually.",
-        description="Test description",
-        status=TaskStatus.TODO,
-        priority=TaskPriority.MEDIUM,
-        category_id=test_category.id
-    )
-    return TaskService.create_task(db_session, task_data, test_user.id)
+def done_task(db_session: Session, test_user: SimpleNamespace, test_category: SimpleNamespace) -> int:
+    """Insert a completed task with a single Core statement and return its id."""
+    return db_session.execute(
+        insert(Task).returning(Task.id),
+        {
+            "title": next(SENTENCES),
+            "status": TaskStatus.DONE,
+            "owner_id": test_user.id,
+            "category_id": test_category.id,
+        },
+    ).scalar_one()
 
 
 # -----------------------
@@ -163,18 +439,23 @@ def test_task(db_session: Session, test_user: User, test_category: Category) ->
 def user_factory(db_session: Session) -> Callable[..., User]:
     created_users: List[User] = []
 
-    def _create_user(**kwargs) -> User:
+    def _create_user(password: Optional[str] = None, refresh: bool = False, **kwargs) -> User:
+        """Create a user; only an explicit ``password`` pays for a fresh hash.
+
+        Pass ``refresh=True`` to reload server-side defaults such as ``created_at``.
+        """
         defaults = {
-            "email": fake.email(),
-            "hashed_password": get_password_hash("TestPassword123!"),
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
+            "email": next(EMAILS),
+            "hashed_password": get_password_hash(password) if password else HASHED_TEST_PASSWORD,
+            "first_name": next(FIRST_NAMES),
+            "last_name": next(LAST_NAMES),
         }
         defaults.update(kwargs)
         user = User(**defaults)
         db_session.add(user)
         db_session.commit()
-        db_session.refresh(user)
+        if refresh:
+            db_session.refresh(user)
         created_users.append(user)
         return user
 
@@ -190,18 +471,19 @@ def user_factory(db_session: Session) -> Callable[..., User]:
 def category_factory(db_session: Session) -> Callable[..., Category]:
     created_categories: List[Category] = []
 
-    def _create_category(user_id: int, **kwargs) -> Category:
+    def _create_category(user_id: int, refresh: bool = False, **kwargs) -> Category:
         defaults = {
-            "name": fake.word().title(),
-            "description": fake.text(max_nb_chars=100),
-            "color": fake.color(),
+            "name": next(WORDS),
+            "description": next(SHORT_TEXTS),
+            "color": next(COLORS),
             "owner_id": user_id
         }
         defaults.update(kwargs)
         category = Category(**defaults)
         db_session.add(category)
         db_session.commit()
-        db_session.refresh(category)
+        if refresh:
+            db_session.refresh(category)
         created_categories.append(category)
         return category
 
@@ -216,10 +498,10 @@ def category_factory(db_session: Session) -> Callable[..., Category]:
 def task_factory(db_session: Session) -> Callable[..., Task]:
     created_tasks: List[Task] = []
 
-    def _create_task(user_id: int, category_id: int, **kwargs) -> Task:
+    def _create_task(user_id: int, category_id: int, refresh: bool = False, **kwargs) -> Task:
         defaults = {
-            "title": fake.sentence(nb_words=3),
-            "description": fake.text(max_nb_chars=200),
+            "title": next(SENTENCES),
+            "description": next(TEXTS),
             "status": TaskStatus.TODO,
             "priority": TaskPriority.MEDIUM,
             "owner_id": user_id,
@@ -229,7 +511,8 @@ def task_factory(db_session: Session) -> Callable[..., Task]:
         task = Task(**defaults)
         db_session.add(task)
         db_session.commit()
-        db_session.refresh(task)
+        if refresh:
+            db_session.refresh(task)
         created_tasks.append(task)
         return task
 
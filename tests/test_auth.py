@@ -1,7 +1,18 @@
 from fastapi import status
 from typing import Dict
+from sqlalchemy import update
 from app.db.models.user import User
-from tests.conftest import assert_error_response
+from app.services.token_service import REFRESH_INDEX_PREFIX, TokenService
+from app.services.user_service import UserService
+from tests.conftest import assert_error_response, auth_headers_for, count_queries, post_json, put_json
+
+REGISTER_PAYLOAD: Dict[str, str] = {
+    "email": "newuser@example.com",
+    "password": "StrongPass123!",
+    "first_name": "John",
+    "last_name": "Doe"
+}
+UPDATE_USER_PAYLOAD: Dict[str, str] = {"first_name": "UpdatedName", "last_name": "UpdatedLast"}
 
 
 # -----------------------
@@ -17,22 +28,15 @@ def assert_user_in_db(db_session, email: str):
 # Registration Tests
 # -----------------------
 def test_register_user(client, db_session):
-    payload: Dict[str, str] = {
-        "email": "newuser@example.com",
-        "password": "StrongPass123!",
-        "first_name": "John",
-        "last_name": "Doe"
-    }
-
-    response = client.post("/api/v1/auth/register", json=payload)
+    response = post_json(client, "/api/v1/auth/register", REGISTER_PAYLOAD)
     assert response.status_code == status.HTTP_201_CREATED
 
     data = response.json()
-    assert data["email"] == payload["email"]
+    assert data["email"] == REGISTER_PAYLOAD["email"]
     assert "id" in data
 
     # Проверка, что пользователь создан в БД
-    assert_user_in_db(db_session, payload["email"])
+    assert_user_in_db(db_session, REGISTER_PAYLOAD["email"])
 
 
 def test_register_user_conflict(client, test_user):
@@ -43,7 +47,7 @@ def test_register_user_conflict(client, test_user):
         "last_name": "Doe"
     }
 
-    response = client.post("/api/v1/auth/register", json=payload)
+    response = post_json(client, "/api/v1/auth/register", payload)
     assert_error_response(
         response,
         expected_status=status.HTTP_409_CONFLICT,
@@ -56,7 +60,7 @@ def test_register_user_conflict(client, test_user):
 # -----------------------
 def test_login_user(client, test_user):
     payload = {"email": test_user.email, "password": "TestPassword123!"}
-    response = client.post("/api/v1/auth/login", json=payload)
+    response = post_json(client, "/api/v1/auth/login", payload)
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -66,7 +70,7 @@ def test_login_user(client, test_user):
 
 def test_login_user_wrong_password(client, test_user):
     payload = {"email": test_user.email, "password": "WrongPassword!"}
-    response = client.post("/api/v1/auth/login", json=payload)
+    response = post_json(client, "/api/v1/auth/login", payload)
 
     assert_error_response(
         response,
@@ -88,11 +92,86 @@ def test_get_current_user(client, auth_headers, test_user):
     assert data["last_name"] == test_user.last_name
 
 
-def test_update_current_user(client, auth_headers, test_user):
-    payload = {"first_name": "UpdatedName", "last_name": "UpdatedLast"}
-    response = client.put("/api/v1/auth/me", json=payload, headers=auth_headers)
+def test_update_current_user(client, another_user):
+    headers = auth_headers_for(another_user.email)
+    response = put_json(client, "/api/v1/auth/me", UPDATE_USER_PAYLOAD, headers=headers)
     assert response.status_code == status.HTTP_200_OK
 
     data = response.json()
-    assert data["first_name"] == payload["first_name"]
-    assert data["last_name"] == payload["last_name"]
+    assert data["first_name"] == UPDATE_USER_PAYLOAD["first_name"]
+    assert data["last_name"] == UPDATE_USER_PAYLOAD["last_name"]
+
+
+# -----------------------
+# Current User Cache Tests
+# -----------------------
+def test_update_current_user_is_visible_on_next_read(client, another_user):
+    headers = auth_headers_for(another_user.email)
+    # The first request caches the user in Redis
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+
+    response = put_json(client, "/api/v1/auth/me", UPDATE_USER_PAYLOAD, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["first_name"] == UPDATE_USER_PAYLOAD["first_name"]
+    assert data["last_name"] == UPDATE_USER_PAYLOAD["last_name"]
+
+
+def test_current_user_cache_hit_skips_sql(client, another_user, db_session):
+    headers = auth_headers_for(another_user.email)
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+
+    with count_queries(db_session.get_bind()) as statements:
+        response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert statements == []
+
+
+def test_user_changed_outside_service_stays_cached_until_invalidated(client, another_user, db_session):
+    headers = auth_headers_for(another_user.email)
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+
+    # A write that bypasses UserService leaves the cached copy in place
+    db_session.execute(update(User).where(User.id == another_user.id).values(is_active=False))
+    db_session.commit()
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+
+    UserService.invalidate_cache(another_user.email)
+    # The app shares this test's session; drop the cached copy it merged, as a new request session would
+    db_session.expire_all()
+    response = client.get("/api/v1/auth/me", headers=headers)
+    assert_error_response(
+        response,
+        expected_status=status.HTTP_400_BAD_REQUEST,
+        expected_message="Inactive user"
+    )
+
+
+# -----------------------
+# Refresh Token Index Tests
+# -----------------------
+def test_revoke_all_user_refresh(redis_client, another_user):
+    tokens = ("refresh-a", "refresh-b")
+    for token in tokens:
+        assert TokenService.store_refresh_token(token, another_user.email)
+
+    TokenService.revoke_all_user_refresh(another_user.email)
+
+    for token in tokens:
+        assert TokenService.get_refresh_owner(token) is None
+    assert not redis_client.redis_client.exists(f"{REFRESH_INDEX_PREFIX}{another_user.email}")
+
+
+def test_revoke_refresh_token_removes_only_its_index_entry(redis_client, another_user):
+    for token in ("refresh-a", "refresh-b"):
+        assert TokenService.store_refresh_token(token, another_user.email)
+
+    assert TokenService.revoke_refresh_token("refresh-a")
+
+    assert TokenService.get_refresh_owner("refresh-a") is None
+    assert TokenService.get_refresh_owner("refresh-b") == another_user.email
+    members = redis_client.redis_client.smembers(f"{REFRESH_INDEX_PREFIX}{another_user.email}")
+    assert members == {"refresh-b"}
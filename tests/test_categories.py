@@ -2,7 +2,17 @@ import pytest
 from fastapi import status
 from typing import Dict
 from app.db.models.category import Category
-from tests.conftest import assert_error_response
+from tests.conftest import assert_error_response, post_json, put_json, request_json
+
+CREATE_CATEGORY_PAYLOAD: Dict[str, str] = {
+    "name": "Work",
+    "description": "Work-related tasks",
+    "color": "#00FF00"
+}
+UPDATE_CATEGORY_PAYLOAD: Dict[str, str] = {
+    "name": "Updated Category",
+    "description": "Updated description"
+}
 
 
 # -----------------------
@@ -27,20 +37,14 @@ def test_list_categories(client, auth_headers, test_category):
 
 
 def test_create_category(client, auth_headers, db_session):
-    payload: Dict[str, str] = {
-        "name": "Work",
-        "description": "Work-related tasks",
-        "color": "#00FF00"
-    }
-
-    response = client.post("/api/v1/categories/", json=payload, headers=auth_headers)
+    response = post_json(client, "/api/v1/categories/", CREATE_CATEGORY_PAYLOAD, headers=auth_headers)
     assert response.status_code == status.HTTP_201_CREATED
 
     data = response.json()
-    assert data["name"] == payload["name"]
-    assert data["color"] == payload["color"]
+    assert data["name"] == CREATE_CATEGORY_PAYLOAD["name"]
+    assert data["color"] == CREATE_CATEGORY_PAYLOAD["color"]
 
-    assert_category_in_db(db_session, payload["name"])
+    assert_category_in_db(db_session, CREATE_CATEGORY_PAYLOAD["name"])
 
 
 def test_get_category(client, auth_headers, test_category):
@@ -62,17 +66,12 @@ def test_get_category_not_found(client, auth_headers):
 
 
 def test_update_category(client, auth_headers, test_category):
-    payload: Dict[str, str] = {
-        "name": "Updated Category",
-        "description": "Updated description"
-    }
-
-    response = client.put(f"/api/v1/categories/{test_category.id}", json=payload, headers=auth_headers)
+    response = put_json(client, f"/api/v1/categories/{test_category.id}", UPDATE_CATEGORY_PAYLOAD, headers=auth_headers)
     assert response.status_code == status.HTTP_200_OK
 
     data = response.json()
-    assert data["name"] == payload["name"]
-    assert data["description"] == payload["description"]
+    assert data["name"] == UPDATE_CATEGORY_PAYLOAD["name"]
+    assert data["description"] == UPDATE_CATEGORY_PAYLOAD["description"]
 
 
 def test_delete_category(client, auth_headers, test_category, db_session):
@@ -100,25 +99,23 @@ def test_get_category_tasks(client, auth_headers, test_category, test_task):
 # Validation Tests (422)
 # -----------------------
 @pytest.mark.parametrize(
-    "payload, expected_type",
+    "method, url, payload",
     [
-        ({"description": "Description only", "color": "#FF0000"}, "validation_error"),  # missing name
-        ({"name": "InvalidColor", "description": "Description", "color": "not-a-color"}, "validation_error"),
-        ({"name": "", "description": "Updated description"}, "validation_error"),
-    ]
+        ("post", "/api/v1/categories/", {"description": "Description only", "color": "#FF0000"}),
+        ("post", "/api/v1/categories/", {"name": "InvalidColor", "description": "Description", "color": "not-a-color"}),
+        ("put", "/api/v1/categories/{category_id}", {"name": "", "description": "Updated description"}),
+    ],
+    ids=["missing_name", "invalid_color", "update_empty_name"],
 )
-def test_category_validation(client, auth_headers, test_category, payload, expected_type):
-    # Determine endpoint and method
-    category_id = getattr(test_category, "id", 1)
-    if "name" in payload and payload["name"] == "":
-        # Update empty name
-        response = client.put(f"/api/v1/categories/{category_id}", json=payload, headers=auth_headers)
-    else:
-        response = client.post("/api/v1/categories/", json=payload, headers=auth_headers)
+def test_category_validation(client, auth_headers, request, method, url, payload):
+    # Only the update case needs an existing category
+    if "{category_id}" in url:
+        url = url.format(category_id=request.getfixturevalue("test_category").id)
+    response = request_json(client, method, url, payload, headers=auth_headers)
 
     assert_error_response(
         response,
         expected_status=status.HTTP_422_UNPROCESSABLE_ENTITY,
         expected_message="Validation error",
-        expected_type=expected_type
+        expected_type="validation_error"
     )
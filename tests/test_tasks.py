@@ -1,24 +1,42 @@
+import base64
+from types import SimpleNamespace
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from app.db.models.task import TaskStatus, TaskPriority, Task
-from app.db.models.category import Category
-from app.db.models.user import User
+from sqlalchemy import func, update
+from app.db.models.task import Task, TaskStatus, TaskPriority
+from app.db.schemas import TaskListResponse, TaskResponse
+from tests.conftest import assert_error_response, auth_headers_for, count_queries, patch_json, post_json
+
+# Every test here runs on the session event loop shared with the async client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Wire values of the enums used in payloads and assertions
+TODO, DONE, ARCHIVED = TaskStatus.TODO.value, TaskStatus.DONE.value, TaskStatus.ARCHIVED.value
+HIGH = TaskPriority.HIGH.value
 
 
 # -----------------------
 # Helpers
 # -----------------------
+async def _do(client: httpx.AsyncClient, headers: dict, method: str, url: str, **kwargs) -> httpx.Response:
+    """Authorised request on the shared keep-alive client."""
+    return await client.request(method, url, headers=headers, **kwargs)
+
+
+TASK_KEYS = frozenset(("id", "title", "description", "status", "priority", "due_date", "owner_id", "category"))
+
+
 def assert_task_keys(task_data: dict):
-    keys = ["id", "title", "description", "status", "priority", "category_id", "owner_id", "created_at", "updated_at", "is_overdue"]
-    for key in keys:
-        assert key in task_data
+    missing = TASK_KEYS - task_data.keys()
+    assert not missing, missing
 
 
 # -----------------------
 # LIST TASKS
 # -----------------------
-def test_list_tasks(client: TestClient, auth_headers, test_task: Task):
-    response = client.get("/api/v1/tasks/", headers=auth_headers)
+async def test_list_tasks(async_client: httpx.AsyncClient, auth_headers, test_task: SimpleNamespace):
+    response = await async_client.get("/api/v1/tasks/", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
 
@@ -33,81 +51,160 @@ def test_list_tasks(client: TestClient, auth_headers, test_task: Task):
     for key in ["total", "skip", "limit", "has_more"]:
         assert key in data
 
+    # The route skips response_model validation, so check the wire shape against the schema here
+    TaskListResponse.model_validate(data)
+    assert data["tasks"][0].keys() == TaskResponse.model_fields.keys()
+
+
+async def test_list_tasks_query_count(async_client: httpx.AsyncClient, auth_headers, test_task: SimpleNamespace, db_session):
+    with count_queries(db_session.get_bind()) as statements:
+        response = await async_client.get("/api/v1/tasks/", headers=auth_headers)
+    assert response.status_code == 200
+
+    # Current user, count and one joined page query: no per-task lazy loads
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) <= 3, selects
+
 
 # -----------------------
 # CREATE TASK
 # -----------------------
-def test_create_task(client: TestClient, auth_headers, test_user: User, test_category: Category):
+async def test_create_task(async_client: httpx.AsyncClient, auth_headers, test_user: SimpleNamespace, test_category: SimpleNamespace):
     task_data = {
         "title": "New Task",
         "description": "Task description",
-        "status": TaskStatus.TODO,
-        "priority": TaskPriority.HIGH,
+        "status": TODO,
+        "priority": HIGH,
         "category_id": test_category.id
     }
-    response = client.post("/api/v1/tasks/", headers=auth_headers, json=task_data)
+    response = await post_json(async_client, "/api/v1/tasks/", task_data, headers=auth_headers)
     assert response.status_code == 201
 
     data = response.json()
     assert data["title"] == task_data["title"]
-    assert data["status"] == task_data["status"].value
-    assert data["priority"] == task_data["priority"].value
-    assert data["category_id"] == test_category.id
+    assert data["status"] == task_data["status"]
+    assert data["priority"] == task_data["priority"]
+    assert data["category"]["id"] == test_category.id
     assert_task_keys(data)
 
 
 # -----------------------
 # UPDATE TASK
 # -----------------------
-def test_update_task(client: TestClient, auth_headers, test_task: Task):
+async def test_update_task(async_client: httpx.AsyncClient, auth_headers, test_task: SimpleNamespace):
     update_data = {
         "title": "Updated Task",
         "description": "Updated description",
-        "status": TaskStatus.DONE
+        "status": DONE
     }
-    response = client.put(f"/api/v1/tasks/{test_task.id}", headers=auth_headers, json=update_data)
+    response = await patch_json(async_client, f"/api/v1/tasks/{test_task.id}", update_data, headers=auth_headers)
     assert response.status_code == 200
 
     data = response.json()
     assert data["title"] == update_data["title"]
-    assert data["status"] == update_data["status"].value
+    assert data["status"] == update_data["status"]
     assert_task_keys(data)
 
 
 # -----------------------
 # ARCHIVE TASK
 # -----------------------
-def test_archive_task(client: TestClient, auth_headers, test_task: Task, db_session):
-    # Обновим статус на DONE перед архивированием
-    db_task = db_session.get(Task, test_task.id)
-    db_task.status = TaskStatus.DONE
-    db_session.commit()
-
-    response = client.post(f"/api/v1/tasks/{test_task.id}/archive", headers=auth_headers)
+async def test_archive_task(async_client: httpx.AsyncClient, auth_headers, done_task: int):
+    response = await async_client.post(f"/api/v1/tasks/{done_task}/archive", headers=auth_headers)
     assert response.status_code == 200
 
     data = response.json()
-    assert data["status"] == TaskStatus.ARCHIVED.value
+    assert data["status"] == ARCHIVED
     assert_task_keys(data)
 
 
 # -----------------------
 # SOFT DELETE AND RESTORE TASK
 # -----------------------
-def test_soft_delete_and_restore_task(client: TestClient, auth_headers, test_task: Task):
-    # Soft delete
-    response = client.delete(f"/api/v1/tasks/{test_task.id}", headers=auth_headers)
-    assert response.status_code == 200
+async def test_soft_delete_and_restore_task(async_client: httpx.AsyncClient, auth_headers, test_task: SimpleNamespace):
+    url = f"/api/v1/tasks/{test_task.id}"
 
-    # Проверим, что задача недоступна
-    response = client.get(f"/api/v1/tasks/{test_task.id}", headers=auth_headers)
-    assert response.status_code == 404
+    # Soft delete, then restore; the order matters, so the calls stay sequential
+    response = await _do(async_client, auth_headers, "DELETE", url)
+    assert response.status_code == 200
 
-    # Restore
-    response = client.post(f"/api/v1/tasks/{test_task.id}/restore", headers=auth_headers)
+    response = await _do(async_client, auth_headers, "POST", f"{url}/restore")
     assert response.status_code == 200
 
     data = response.json()
     assert data["id"] == test_task.id
     assert data["title"] == test_task.title
     assert_task_keys(data)
+
+
+@pytest.mark.slow
+async def test_soft_deleted_task_not_found(async_client: httpx.AsyncClient, auth_headers, test_task: SimpleNamespace):
+    url = f"/api/v1/tasks/{test_task.id}"
+    response = await _do(async_client, auth_headers, "DELETE", url)
+    assert response.status_code == 200
+
+    # Проверим, что задача недоступна
+    response = await _do(async_client, auth_headers, "GET", url)
+    assert response.status_code == 404
+
+
+async def test_get_soft_deleted_task_returns_404(async_client: httpx.AsyncClient, auth_headers, done_task: int, db_session):
+    db_session.execute(update(Task).where(Task.id == done_task).values(deleted_at=func.now()))
+
+    response = await _do(async_client, auth_headers, "GET", f"/api/v1/tasks/{done_task}")
+    assert_error_response(response, expected_status=404, expected_message="Task not found")
+
+
+# -----------------------
+# CURSOR PAGINATION
+# -----------------------
+async def test_cursor_pagination_walks_pages(async_client: httpx.AsyncClient, another_user, task_factory):
+    headers = auth_headers_for(another_user.email)
+    created_ids = {task_factory(another_user.id, None).id for _ in range(3)}
+
+    response = await async_client.get("/api/v1/tasks/", headers=headers, params={"limit": 2})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["tasks"]) == 2
+    assert first_page["has_more"] is True
+    assert first_page["next_cursor"] is not None
+
+    response = await async_client.get(
+        "/api/v1/tasks/", headers=headers, params={"limit": 2, "cursor": first_page["next_cursor"]}
+    )
+    assert response.status_code == 200
+    last_page = response.json()
+    assert len(last_page["tasks"]) == 1
+    assert last_page["has_more"] is False
+    assert last_page["next_cursor"] is None
+    # Counting is skipped in cursor mode
+    assert last_page["total"] is None
+
+    first_ids = {task["id"] for task in first_page["tasks"]}
+    last_ids = {task["id"] for task in last_page["tasks"]}
+    assert not first_ids & last_ids
+    assert first_ids | last_ids == created_ids
+
+
+async def test_cursor_pagination_invalid_cursor(async_client: httpx.AsyncClient, auth_headers):
+    response = await async_client.get("/api/v1/tasks/", headers=auth_headers, params={"cursor": "not a cursor"})
+    assert_error_response(response, expected_status=422, expected_message="Invalid cursor")
+
+
+@pytest.mark.parametrize(
+    "sort_params",
+    [{"sort_by": "title"}, {"sort_order": "asc"}],
+    ids=["sort_by", "sort_order"],
+)
+async def test_cursor_pagination_requires_default_order(
+    async_client: httpx.AsyncClient, auth_headers, sort_params: dict
+):
+    cursor = base64.urlsafe_b64encode(b"2024-01-01T00:00:00|1").decode()
+    response = await async_client.get(
+        "/api/v1/tasks/", headers=auth_headers, params={"cursor": cursor, **sort_params}
+    )
+    assert_error_response(
+        response,
+        expected_status=422,
+        expected_message="Cursor pagination requires sorting by created_at desc"
+    )